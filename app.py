@@ -11,11 +11,76 @@
 
 import io
 import zipfile
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 
+import numpy as np
+import openpyxl
 import pandas as pd
 import streamlit as st
 
+# Copy-on-write lets us drop defensive full-frame copies: derived frames
+# share blocks until actually mutated. Always on from pandas 3.0.
+if int(pd.__version__.split(".")[0]) < 3:
+    pd.options.mode.copy_on_write = True
+
+# Prefer faster parse engines when available; None falls back to pandas defaults.
+try:
+    import python_calamine  # noqa: F401  (Rust-based .xlsx reader)
+
+    EXCEL_READ_ENGINE = "calamine"
+except ImportError:
+    EXCEL_READ_ENGINE = None
+
+try:
+    import pyarrow  # noqa: F401  (multithreaded CSV parser)
+
+    CSV_READ_ENGINE = "pyarrow"
+except ImportError:
+    CSV_READ_ENGINE = None
+
+try:
+    import xlsxwriter  # faster cell path than openpyxl for writes
+except ImportError:
+    xlsxwriter = None
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+if numba is not None:
+
+    # No cache=True: Streamlit executes this file as a dynamic module, and
+    # numba's on-disk cache cannot re-import such modules when loading.
+    @numba.njit
+    def _hash_join_diff(cat_hashes, cat_pp, cat_sp, map_hashes, map_pp, map_sp):
+        """
+        Compiled hash join + price diff in one pass over the mapped rows.
+
+        Returns, per mapped row, the matched catalog row (or -1) and a
+        flag for "matched and at least one price differs" (both-NaN
+        counts as equal).
+        """
+        table = {}
+        for i in range(cat_hashes.shape[0]):
+            table[cat_hashes[i]] = i
+
+        pos = np.empty(map_hashes.shape[0], dtype=np.int64)
+        upd = np.zeros(map_hashes.shape[0], dtype=np.bool_)
+        for j in range(map_hashes.shape[0]):
+            h = map_hashes[j]
+            p = table[h] if h in table else -1
+            pos[j] = p
+            if p >= 0:
+                pp_diff = cat_pp[p] != map_pp[j] and not (np.isnan(cat_pp[p]) and np.isnan(map_pp[j]))
+                sp_diff = cat_sp[p] != map_sp[j] and not (np.isnan(cat_sp[p]) and np.isnan(map_sp[j]))
+                upd[j] = pp_diff or sp_diff
+        return pos, upd
+
+else:
+    _hash_join_diff = None
+
 
 STANDARD_HEADERS = [
     "Supplier",
@@ -49,27 +114,60 @@ def is_excel(name: str) -> bool:
     return name.endswith(".xlsx") or name.endswith(".xlsm") or name.endswith(".xls")
 
 
-def read_uploaded_file(uploaded_file) -> pd.DataFrame:
+@st.cache_data(show_spinner=False, max_entries=4)
+def _parse_bytes(data: bytes, filename: str) -> pd.DataFrame:
     """
-    Reads Streamlit UploadedFile (CSV or Excel) into a DataFrame.
-    Uses dtype=object to preserve strings and avoid inference surprises.
+    Parses raw CSV/Excel bytes into a DataFrame. Cached on the byte
+    content so Streamlit reruns don't re-parse an unchanged upload.
     """
-    if uploaded_file is None:
-        raise ValueError("No file provided.")
-
-    filename = uploaded_file.name
     if is_excel(filename):
-        df = pd.read_excel(uploaded_file, sheet_name=0, dtype=object)
+        df = pd.read_excel(io.BytesIO(data), sheet_name=0, dtype=object, engine=EXCEL_READ_ENGINE)
+    elif CSV_READ_ENGINE == "pyarrow":
+        # pyarrow.csv parses multithreaded into a columnar Arrow table — a
+        # fraction of the memory of one Python str object per cell. All
+        # columns are read as Arrow strings (the dtype=object equivalent)
+        # and "" stays an empty string rather than NA, matching the
+        # keep_default_na=False behavior of the fallback below.
+        import csv
+
+        import pyarrow.csv as pacsv
+
+        header_line = io.TextIOWrapper(io.BytesIO(data), encoding="utf-8-sig", errors="replace").readline()
+        column_names = next(csv.reader([header_line]), [])
+        table = pacsv.read_csv(
+            io.BytesIO(data),
+            convert_options=pacsv.ConvertOptions(
+                column_types={name: pyarrow.string() for name in column_names},
+                null_values=[],
+                strings_can_be_null=False,
+            ),
+        )
+        df = table.to_pandas(types_mapper={pyarrow.string(): pd.StringDtype("pyarrow")}.get)
     else:
         # keep_default_na=False keeps empty strings instead of NaN for CSVs
-        df = pd.read_csv(uploaded_file, dtype=object, keep_default_na=False)
+        df = pd.read_csv(io.BytesIO(data), dtype=object, keep_default_na=False)
 
     df.columns = [str(c).strip() for c in df.columns]
     return df
 
 
+def read_uploaded_file(uploaded_file) -> pd.DataFrame:
+    """
+    Reads Streamlit UploadedFile (CSV or Excel) into a DataFrame.
+    Uses dtype=object to preserve strings and avoid inference surprises.
+    """
+    if uploaded_file is None:
+        raise ValueError("No file provided.")
+
+    return _parse_bytes(uploaded_file.getvalue(), uploaded_file.name)
+
+
 def normalize_itemcode(series: pd.Series) -> pd.Series:
-    return series.astype(str).str.strip()
+    # String-dtype (e.g. Arrow-backed) columns strip via the native kernel;
+    # only non-string columns need the astype(str) round-trip first.
+    if not isinstance(series.dtype, pd.StringDtype):
+        series = series.astype(str)
+    return series.str.strip()
 
 
 def to_num(series: pd.Series) -> pd.Series:
@@ -78,10 +176,26 @@ def to_num(series: pd.Series) -> pd.Series:
     - strips commas and whitespace
     - converts blanks/"nan"/"None" -> None
     - pd.to_numeric(..., errors="coerce")
+
+    Values that coerce cleanly skip the string-cleanup pass entirely;
+    only the stragglers pay for the astype(str)/replace round-trip.
+    """
+    num = pd.to_numeric(series, errors="coerce")
+    bad = num.isna() & series.notna()
+    if bad.any():
+        s = series[bad].astype(str).str.replace(",", "", regex=False).str.strip()
+        s = s.replace({"": None, "nan": None, "None": None})
+        num = num.astype("float64")
+        num.loc[bad] = pd.to_numeric(s, errors="coerce")
+    return num
+
+
+def _unique_indexed(df: pd.DataFrame, key: str = "ItemCode") -> pd.DataFrame:
     """
-    s = series.astype(str).str.replace(",", "", regex=False).str.strip()
-    s = s.replace({"": None, "nan": None, "None": None})
-    return pd.to_numeric(s, errors="coerce")
+    Deduped (keep last), key-indexed lookup for safe matching.
+    Expects the key column to be normalized already.
+    """
+    return df.drop_duplicates(subset=[key], keep="last").set_index(key)
 
 
 def build_df_mapped(df_source: pd.DataFrame, mapping: dict, marina_location_id: str, addition_dt: str) -> pd.DataFrame:
@@ -89,29 +203,41 @@ def build_df_mapped(df_source: pd.DataFrame, mapping: dict, marina_location_id:
     Step 1 – Source File Mapping -> df_mapped with STANDARD_HEADERS.
     Dedupes safely by ItemCode (keep last), drops blank ItemCodes.
     """
-    # Build with vectorized assignments for better large-file performance.
-    df_mapped = pd.DataFrame(index=df_source.index)
-
+    # One select/rename/reindex reuses the source column blocks instead of
+    # assigning (and reallocating) field by field.
+    rename_map = {}
     for field in STANDARD_HEADERS:
         if field in ("MarinaLocationId", "AdditionDatetime"):
             continue
+        src_col = mapping.get(field, "(not mapped)")
+        if src_col and src_col != "(not mapped)" and src_col not in rename_map:
+            rename_map[src_col] = field
 
+    df_mapped = (
+        df_source[list(rename_map)]
+        .rename(columns=rename_map)
+        .reindex(columns=STANDARD_HEADERS, fill_value="")
+    )
+
+    # A source column mapped to several output fields is only renamed once;
+    # copy it into the remaining fields.
+    for field in STANDARD_HEADERS:
         src_col = mapping.get(field, "(not mapped)")
-        if src_col and src_col != "(not mapped)":
+        if src_col and src_col != "(not mapped)" and rename_map.get(src_col) != field:
             df_mapped[field] = df_source[src_col]
-        else:
-            df_mapped[field] = ""
 
     df_mapped["MarinaLocationId"] = marina_location_id
     df_mapped["AdditionDatetime"] = addition_dt
-    df_mapped = df_mapped.reindex(columns=STANDARD_HEADERS)
 
     df_mapped["ItemCode"] = normalize_itemcode(df_mapped["ItemCode"])
-    df_mapped = df_mapped[df_mapped["ItemCode"] != ""].copy()
+    df_mapped = df_mapped[df_mapped["ItemCode"] != ""]
 
     # Safe dedupe: keep last occurrence for a given ItemCode
     df_mapped = df_mapped.drop_duplicates(subset=["ItemCode"], keep="last").reset_index(drop=True)
 
+    # Lets compare_and_build_exports skip re-normalizing ItemCode.
+    df_mapped.attrs["itemcode_normalized"] = True
+
     return df_mapped
 
 
@@ -137,60 +263,131 @@ def compare_and_build_exports(df_mapped: pd.DataFrame, df_catalog: pd.DataFrame)
             f"{', '.join(required_catalog_cols)}. Missing: {', '.join(missing)}"
         )
 
-    df_catalog_updated = df_catalog.copy()
-    original_col_order = df_catalog_updated.columns.tolist()
+    original_col_order = df_catalog.columns.tolist()
 
-    df_catalog_updated["ItemCode"] = normalize_itemcode(df_catalog_updated["ItemCode"])
-    df_mapped_local = df_mapped.copy()
-    df_mapped_local["ItemCode"] = normalize_itemcode(df_mapped_local["ItemCode"])
-
-    # Lookups for safe matching (avoid ambiguous duplicates)
-    catalog_lookup = df_catalog_updated.drop_duplicates(subset=["ItemCode"], keep="last").set_index("ItemCode")
-    mapped_lookup = df_mapped_local.drop_duplicates(subset=["ItemCode"], keep="last").set_index("ItemCode")
-
-    # Index operations scale better than set/list conversions on very large catalogs.
-    both_codes = catalog_lookup.index.intersection(mapped_lookup.index, sort=False)
-    new_codes = mapped_lookup.index.difference(catalog_lookup.index, sort=False)
+    # assign() gives a fresh frame without duplicating the untouched
+    # columns (copy-on-write), so the caller's frames are never mutated.
+    df_catalog_updated = df_catalog.assign(ItemCode=normalize_itemcode(df_catalog["ItemCode"]))
+    if df_mapped.attrs.get("itemcode_normalized"):
+        # build_df_mapped already stripped the codes; don't redo the pass.
+        df_mapped_local = df_mapped
+    else:
+        df_mapped_local = df_mapped.assign(ItemCode=normalize_itemcode(df_mapped["ItemCode"]))
+
+    # Lookups for safe matching (avoid ambiguous duplicates). df_mapped
+    # arrives deduped by ItemCode from build_df_mapped, so only the
+    # catalog pays for a duplicate scan here.
+    catalog_lookup = _unique_indexed(df_catalog_updated)
+    mapped_lookup = df_mapped_local.set_index("ItemCode")
+    if not mapped_lookup.index.is_unique:
+        mapped_lookup = df_mapped_local.pipe(_unique_indexed)
+
+    # New Items must carry the source values as-is, so keep the raw mapped
+    # prices around before they are parsed (shares blocks, no copy).
+    mapped_raw_prices = mapped_lookup[["PurchasePrice", "SalesPrice"]]
+
+    # Parse the price columns exactly once up front; the comparison below
+    # and the values assigned into the catalog are then real float64
+    # instead of raw strings re-parsed per use.
+    for col in ("PurchasePrice", "SalesPrice"):
+        catalog_lookup[col] = to_num(catalog_lookup[col])
+        mapped_lookup[col] = to_num(mapped_lookup[col])
+
+    mapped_codes = mapped_lookup.index.to_numpy()
+    codes_to_update = None
+
+    if _hash_join_diff is not None and len(catalog_lookup) > 0 and len(mapped_codes) > 0:
+        # Compiled kernel: hash join and price diff in a single native pass.
+        cat_codes = catalog_lookup.index.to_numpy()
+        pos, upd = _hash_join_diff(
+            pd.util.hash_array(cat_codes),
+            catalog_lookup["PurchasePrice"].to_numpy(dtype=np.float64, na_value=np.nan),
+            catalog_lookup["SalesPrice"].to_numpy(dtype=np.float64, na_value=np.nan),
+            pd.util.hash_array(mapped_codes),
+            mapped_lookup["PurchasePrice"].to_numpy(dtype=np.float64, na_value=np.nan),
+            mapped_lookup["SalesPrice"].to_numpy(dtype=np.float64, na_value=np.nan),
+        )
+        mask_both = pos >= 0
+        hits = np.flatnonzero(mask_both)
+        if len(hits) > 0:
+            # Reject 64-bit hash collisions by comparing the actual codes.
+            genuine = cat_codes[pos[hits]] == mapped_codes[hits]
+            mask_both[hits] = genuine
+            upd[hits[~genuine]] = False
+        codes_to_update = mapped_lookup.index[mask_both & upd]
+    else:
+        # Fallback: sort the catalog codes once and binary-search the mapped
+        # codes into them — a cache-friendly O(M log N) scan that classifies
+        # every mapped code as existing/new without a catalog hashtable.
+        cat_codes = np.sort(catalog_lookup.index.to_numpy())
+        mask_both = np.zeros(len(mapped_codes), dtype=bool)
+        if len(cat_codes) > 0 and len(mapped_codes) > 0:
+            pos = np.searchsorted(cat_codes, mapped_codes)
+            in_range = pos < len(cat_codes)
+            mask_both[in_range] = cat_codes[pos[in_range]] == mapped_codes[in_range]
+
+    both_codes = mapped_lookup.index[mask_both]
+    new_codes = mapped_lookup.index[~mask_both]
 
     # Update prices where codes exist in both and prices differ
     updated_count = 0
-    codes_to_update = []
-
-    if len(both_codes) > 0:
-        catalog_pp = to_num(catalog_lookup.loc[both_codes, "PurchasePrice"])
-        catalog_sp = to_num(catalog_lookup.loc[both_codes, "SalesPrice"])
-        mapped_pp = to_num(mapped_lookup.loc[both_codes, "PurchasePrice"])
-        mapped_sp = to_num(mapped_lookup.loc[both_codes, "SalesPrice"])
-
-        needs_update = (catalog_pp.ne(mapped_pp)) | (catalog_sp.ne(mapped_sp))
-        codes_to_update = needs_update[needs_update].index.astype(str).tolist()
-
-        if codes_to_update:
-            # Index-aligned assignment avoids large dict/map overhead.
-            catalog_indexed = df_catalog_updated.set_index("ItemCode", drop=False)
-            catalog_indexed.loc[codes_to_update, "PurchasePrice"] = mapped_lookup.loc[codes_to_update, "PurchasePrice"]
-            catalog_indexed.loc[codes_to_update, "SalesPrice"] = mapped_lookup.loc[codes_to_update, "SalesPrice"]
-            df_catalog_updated = catalog_indexed.reset_index(drop=True)
 
-            updated_count = len(codes_to_update)
-
-    # Build New Items sheet
+    if codes_to_update is None:
+        codes_to_update = mapped_lookup.index[:0]
+        if len(both_codes) > 0:
+            catalog_pp = catalog_lookup.loc[both_codes, "PurchasePrice"]
+            catalog_sp = catalog_lookup.loc[both_codes, "SalesPrice"]
+            mapped_pp = mapped_lookup.loc[both_codes, "PurchasePrice"]
+            mapped_sp = mapped_lookup.loc[both_codes, "SalesPrice"]
+
+            a_pp = catalog_pp.to_numpy(dtype=np.float64, na_value=np.nan)
+            a_sp = catalog_sp.to_numpy(dtype=np.float64, na_value=np.nan)
+            b_pp = mapped_pp.to_numpy(dtype=np.float64, na_value=np.nan)
+            b_sp = mapped_sp.to_numpy(dtype=np.float64, na_value=np.nan)
+
+            # Plain numpy ufuncs, with both-NaN treated as equal (NaN != NaN
+            # would otherwise flag rows where neither side has a price).
+            pp_diff = (a_pp != b_pp) & ~(np.isnan(a_pp) & np.isnan(b_pp))
+            sp_diff = (a_sp != b_sp) & ~(np.isnan(a_sp) & np.isnan(b_sp))
+            needs_update = pp_diff | sp_diff
+            codes_to_update = both_codes[needs_update]
+
+    if len(codes_to_update) > 0:
+        # String-dtype (e.g. Arrow-backed) price columns reject float
+        # setitem; widen them to object before splicing in the parsed
+        # numbers. Untouched rows keep their original values.
+        for col in ("PurchasePrice", "SalesPrice"):
+            if df_catalog_updated[col].dtype != object:
+                df_catalog_updated[col] = df_catalog_updated[col].astype(object)
+
+        # Positional assignment touches only the two price columns,
+        # instead of rebuilding every column via set_index/reset_index.
+        pos_map = pd.Series(
+            np.arange(len(df_catalog_updated)), index=df_catalog_updated["ItemCode"].to_numpy()
+        )
+        # Duplicate catalog codes map to multiple positions; the mapped
+        # value is repeated for each of them (same as index alignment).
+        selected = pos_map.loc[codes_to_update]
+        pos = selected.to_numpy()
+        pp_idx = df_catalog_updated.columns.get_loc("PurchasePrice")
+        sp_idx = df_catalog_updated.columns.get_loc("SalesPrice")
+        df_catalog_updated.iloc[pos, pp_idx] = mapped_lookup.loc[selected.index, "PurchasePrice"].to_numpy()
+        df_catalog_updated.iloc[pos, sp_idx] = mapped_lookup.loc[selected.index, "SalesPrice"].to_numpy()
+
+        updated_count = len(codes_to_update)
+
+    # Build New Items sheet — slice the lookup and reorder in place; the
+    # dict-of-Series constructor re-copied every column.
     new_items_df = pd.DataFrame()
     if len(new_codes) > 0:
-        df_new = mapped_lookup.loc[new_codes].reset_index()
-
-        new_items_df = pd.DataFrame(
-            {
-                "Supplier": df_new.get("Supplier", ""),
-                "ItemCode": df_new.get("ItemCode", ""),
-                "Description": df_new.get("Description", ""),
-                "PurchasePrice": df_new.get("PurchasePrice", ""),
-                "SalesPrice": df_new.get("SalesPrice", ""),
-                "SV_ManufacturerId": df_new.get("SV_ManufacturerId", ""),
-                "ListCategory": df_new.get("ListCategory", ""),
-                "MarinaLocationId": df_new.get("MarinaLocationId", ""),
-                "AdditionDatetime": df_new.get("AdditionDatetime", ""),
-            }
+        new_items_df = (
+            mapped_lookup.loc[new_codes]
+            .assign(
+                PurchasePrice=mapped_raw_prices["PurchasePrice"],
+                SalesPrice=mapped_raw_prices["SalesPrice"],
+            )
+            .reset_index()
+            .reindex(columns=STANDARD_HEADERS, fill_value="")
         )
 
     # Ensure column order is preserved in Catalog export
@@ -199,15 +396,71 @@ def compare_and_build_exports(df_mapped: pd.DataFrame, df_catalog: pd.DataFrame)
     return df_catalog_updated, new_items_df, updated_count, len(new_codes)
 
 
-def make_excel_bytes(df_export: pd.DataFrame, sheet_name: str) -> bytes:
+def make_excel_bytes(df_export: pd.DataFrame, sheet_name: str, engine: str = "xlsxwriter") -> bytes:
     """
-    Writes a single DataFrame to an in-memory Excel file using openpyxl.
+    Writes a single DataFrame to an in-memory Excel file, streaming rows
+    instead of building the full in-memory cell grid (much faster and
+    bounded memory on large exports).
+
+    Uses xlsxwriter in constant-memory mode by default; falls back to
+    openpyxl's write-only mode when xlsxwriter is not installed.
     """
     output = io.BytesIO()
-    with pd.ExcelWriter(output, engine="openpyxl") as writer:
-        df_export.to_excel(writer, index=False, sheet_name=sheet_name)
-    output.seek(0)
-    return output.read()
+    if len(df_export) > 0:
+        # NaN -> None so both writers produce blank cells instead of 'nan'
+        cells = df_export.astype(object).where(df_export.notna(), None)
+    else:
+        cells = df_export
+
+    if engine == "xlsxwriter" and xlsxwriter is not None:
+        wb = xlsxwriter.Workbook(output, {"constant_memory": True, "strings_to_numbers": False})
+        ws = wb.add_worksheet(sheet_name)
+        ws.write_row(0, 0, [str(c) for c in cells.columns])
+        for i, row in enumerate(cells.itertuples(index=False, name=None), start=1):
+            ws.write_row(i, 0, row)
+        wb.close()
+    else:
+        wb = openpyxl.Workbook(write_only=True)
+        ws = wb.create_sheet(sheet_name)
+        ws.append(list(cells.columns))
+        for row in cells.itertuples(index=False, name=None):
+            ws.append(row)
+        wb.save(output)
+    return output.getvalue()
+
+
+def make_csv_bytes(df_export: pd.DataFrame) -> bytes:
+    """
+    CSV serialization (C-implemented) — much faster than xlsx when the
+    user doesn't need Excel formatting.
+    """
+    output = io.BytesIO()
+    df_export.to_csv(output, index=False)
+    return output.getvalue()
+
+
+def make_parquet_bytes(df_export: pd.DataFrame) -> bytes:
+    """
+    Parquet serialization via pyarrow — compact and fast for large catalogs.
+
+    Arrow needs a single type per column, but price updates leave mixed
+    str/float object columns (original strings plus parsed floats on the
+    updated rows). Such columns are coerced to numeric when every value
+    parses, otherwise to strings.
+    """
+    df_export = df_export.copy()
+    for col in df_export.columns[df_export.dtypes == object]:
+        s = df_export[col]
+        if s.dropna().map(type).nunique() > 1:
+            num = pd.to_numeric(s, errors="coerce")
+            if bool((num.notna() | s.isna()).all()):
+                df_export[col] = num
+            else:
+                df_export[col] = s.astype(str).where(s.notna())
+
+    output = io.BytesIO()
+    df_export.to_parquet(output, engine="pyarrow", compression="zstd")
+    return output.getvalue()
 
 
 # ---------------------------
@@ -356,6 +609,13 @@ with right:
     elif df_catalog is None:
         st.warning("Upload Marina catalog first (Step 2).")
     else:
+        export_format = st.radio(
+            "Export format",
+            options=["xlsx", "csv", "parquet"],
+            horizontal=True,
+            help="csv/parquet serialize much faster than xlsx when Excel formatting isn't needed.",
+        )
+
         # Export button
         if st.button("Export Updated Catalog + New Items", type="primary", use_container_width=True):
             try:
@@ -365,21 +625,41 @@ with right:
                 )
 
                 ts = datetime.now().strftime("%Y%m%d_%H%M%S")
-                catalog_filename = f"updated_catalog_{ts}.xlsx"
-                new_items_filename = f"new_items_{ts}.xlsx"
+                catalog_filename = f"updated_catalog_{ts}.{export_format}"
+                new_items_filename = f"new_items_{ts}.{export_format}"
                 zip_filename = f"catalog_exports_{ts}.zip"
 
-                catalog_xlsx_bytes = make_excel_bytes(df_catalog_updated, "Catalog")
                 new_items_export_df = new_items_df if new_items_df is not None else pd.DataFrame()
-                new_items_xlsx_bytes = make_excel_bytes(new_items_export_df, "New Items")
+                if export_format == "csv":
+                    catalog_export_bytes = make_csv_bytes(df_catalog_updated)
+                    new_items_export_bytes = make_csv_bytes(new_items_export_df)
+                elif export_format == "parquet":
+                    catalog_export_bytes = make_parquet_bytes(df_catalog_updated)
+                    new_items_export_bytes = make_parquet_bytes(new_items_export_df)
+                else:
+                    # Write both workbooks in parallel worker processes so a
+                    # large catalog doesn't serialize behind the script thread;
+                    # wall clock becomes max(a, b) instead of a + b.
+                    with st.spinner("Writing Excel files…"):
+                        try:
+                            with ProcessPoolExecutor(max_workers=2) as executor:
+                                catalog_future = executor.submit(make_excel_bytes, df_catalog_updated, "Catalog")
+                                new_items_future = executor.submit(make_excel_bytes, new_items_export_df, "New Items")
+                                catalog_export_bytes = catalog_future.result()
+                                new_items_export_bytes = new_items_future.result()
+                        except Exception:
+                            # Some deployments can't spawn workers from the
+                            # script module; fall back to in-process writes.
+                            catalog_export_bytes = make_excel_bytes(df_catalog_updated, "Catalog")
+                            new_items_export_bytes = make_excel_bytes(new_items_export_df, "New Items")
 
                 zip_buffer = io.BytesIO()
-                # Use STORE (no compression) to reduce CPU time on large exports.
+                # Use STORE (no compression): xlsx/parquet members are already
+                # compressed internally, so DEFLATE would burn CPU for nothing.
                 with zipfile.ZipFile(zip_buffer, mode="w", compression=zipfile.ZIP_STORED) as zf:
-                    zf.writestr(catalog_filename, catalog_xlsx_bytes)
-                    zf.writestr(new_items_filename, new_items_xlsx_bytes)
-                zip_buffer.seek(0)
-                zip_bytes = zip_buffer.read()
+                    zf.writestr(catalog_filename, catalog_export_bytes)
+                    zf.writestr(new_items_filename, new_items_export_bytes)
+                zip_bytes = zip_buffer.getvalue()
 
                 st.success(f"Export ready. Updated items: {updated_count} | New items: {new_count}")
 
@@ -8,6 +8,15 @@ import traceback
 import threading
 from pathlib import Path
 
+# Prefer the faster Excel engine when available; None falls back to the
+# pandas default. CSV stays on the C parser: the pyarrow engine infers
+# column types before applying dtype=str, turning codes like "001" into "1".
+try:
+    import python_calamine  # noqa: F401  (Rust-based .xlsx reader)
+    EXCEL_READ_ENGINE = "calamine"
+except ImportError:
+    EXCEL_READ_ENGINE = None
+
 # Logging setup
 logging.basicConfig(
     filename='parts_catalog_mapper.log',
@@ -73,7 +82,7 @@ class ColumnMapperApp:
         suffix = Path(file_path).suffix.lower()
         if suffix == ".csv":
             return pd.read_csv(file_path, dtype=str)
-        return pd.read_excel(file_path, dtype=str)
+        return pd.read_excel(file_path, dtype=str, engine=EXCEL_READ_ENGINE)
 
     def load_file(self):
         file_path = filedialog.askopenfilename(filetypes=[("Excel/CSV Files", "*.xlsx *.csv")])
@@ -151,42 +160,55 @@ class ColumnMapperApp:
             original_catalog_columns = catalog.columns.tolist()
             mapped = self.df_mapped.copy()
 
-            catalog["PurchasePrice"] = pd.to_numeric(catalog["PurchasePrice"], errors="coerce")
-            catalog["SalesPrice"] = pd.to_numeric(catalog["SalesPrice"], errors="coerce")
-            mapped["PurchasePrice"] = pd.to_numeric(mapped["PurchasePrice"], errors="coerce")
-            mapped["SalesPrice"] = pd.to_numeric(mapped["SalesPrice"], errors="coerce")
+            # float64 so cross-frame assignment never hits an int column
+            for col in NUMERIC_COLUMNS:
+                catalog[col] = pd.to_numeric(catalog[col], errors="coerce").astype("float64")
+                mapped[col] = pd.to_numeric(mapped[col], errors="coerce").astype("float64")
 
             catalog = catalog.drop_duplicates(subset="ItemCode", keep="first")
             catalog = catalog.set_index("ItemCode")
-            new_items = []
-
-            for _, row in mapped.iterrows():
-                itemcode = row["ItemCode"]
-                if itemcode in catalog.index:
-                    cat_row = catalog.loc[itemcode]
-                    if (
-                        not pd.isna(row["PurchasePrice"]) and
-                        not pd.isna(row["SalesPrice"]) and
-                        (
-                            cat_row["PurchasePrice"] != row["PurchasePrice"] or
-                            cat_row["SalesPrice"] != row["SalesPrice"]
-                        )
-                    ):
-                        catalog.at[itemcode, "PurchasePrice"] = row["PurchasePrice"]
-                        catalog.at[itemcode, "SalesPrice"] = row["SalesPrice"]
-                else:
-                    new_items.append(row)
+            # keep="last" so the last mapped occurrence wins, matching the
+            # old row-by-row behavior where later rows overwrote earlier ones
+            mapped = mapped.drop_duplicates(subset="ItemCode", keep="last")
+            mapped = mapped.set_index("ItemCode", drop=False)
+
+            both_codes = catalog.index.intersection(mapped.index)
+
+            if len(both_codes) > 0:
+                cat_prices = catalog.loc[both_codes, NUMERIC_COLUMNS]
+                map_prices = mapped.loc[both_codes, NUMERIC_COLUMNS]
+                # Only update rows where the mapped file has both prices and
+                # at least one of them differs from the catalog
+                has_prices = map_prices.notna().all(axis=1).to_numpy()
+                diff = (
+                    (cat_prices["PurchasePrice"].to_numpy() != map_prices["PurchasePrice"].to_numpy())
+                    | (cat_prices["SalesPrice"].to_numpy() != map_prices["SalesPrice"].to_numpy())
+                )
+                changed = both_codes[has_prices & diff]
+                if len(changed) > 0:
+                    catalog.loc[changed, NUMERIC_COLUMNS] = mapped.loc[changed, NUMERIC_COLUMNS].to_numpy()
+
+            new_codes = mapped.index.difference(catalog.index)
 
             catalog.reset_index(inplace=True)
             catalog = catalog[original_catalog_columns]
-            df_new = pd.DataFrame(new_items)
+            df_new = mapped.loc[new_codes].reset_index(drop=True)
 
             if not df_new.empty:
-                df_new.insert(0, "Id", "*")
-                df_new.insert(df_new.columns.get_loc("MarinaLocationId"), "RecordStatusId", 1)
-                df_new["ItemMaster_Id"] = "NULL"
-                df_new["AspNetUser_Id"] = "NULL"
-                df_new["SupersededItemCode"] = "NULL"
+                # One broadcast allocation per constant column plus a single
+                # reorder is cheaper than repeated insert() block shuffles.
+                df_new = df_new.assign(
+                    Id="*",
+                    RecordStatusId=1,
+                    ItemMaster_Id="NULL",
+                    AspNetUser_Id="NULL",
+                    SupersededItemCode="NULL",
+                )
+                loc = OUTPUT_COLUMNS.index("MarinaLocationId")
+                df_new = df_new[
+                    ["Id"] + OUTPUT_COLUMNS[:loc] + ["RecordStatusId"] + OUTPUT_COLUMNS[loc:]
+                    + ["ItemMaster_Id", "AspNetUser_Id", "SupersededItemCode"]
+                ]
 
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             updated_path = os.path.join(folder, f"updated_catalog_{timestamp}.xlsx")